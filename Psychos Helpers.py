@@ -13,107 +13,198 @@ bl_info = {
 }
 
 import bpy
+import re
+import numpy as np
+from collections import defaultdict
+
+# Set to True to print every mapped axis to the system console
+DEBUG = False
+
+# Target axis enum value -> (target array index, value scale)
+AXIS_MAPPING = {
+    'X+': (0, 1.0), 'X-': (0, -1.0), 'Y+': (1, 1.0), 'Y-': (1, -1.0), 'Z+': (2, 1.0), 'Z-': (2, -1.0)
+}
+
+# Location data path of a pose bone, group 1 is the bone name
+BONE_LOCATION_PATH = re.compile(r'pose\.bones\["(.+)"\]\.location')
+
+def get_mapping_settings(settings, use_secondary_mapping):
+    """Return the axis mapping and replace option of the primary or secondary mapping.
+
+    settings is the PsychosHelpersSettings of the scene.
+
+    The axis mapping holds the (target array index, value scale) of each source axis.
+    """
+    if use_secondary_mapping:
+        source_axes = [
+            settings.secondary_x_axis,
+            settings.secondary_y_axis,
+            settings.secondary_z_axis
+        ]
+        replace_all = settings.secondary_replace_all_keyframes
+    else:
+        source_axes = [
+            settings.source_x_axis,
+            settings.source_y_axis,
+            settings.source_z_axis
+        ]
+        replace_all = settings.replace_all_keyframes
+    return tuple(AXIS_MAPPING[axis] for axis in source_axes), replace_all
+
+def index_action_fcurves(action):
+    """Index the fcurves of action in one pass.
+
+    Returns a (data_path, array_index) -> fcurve dict and a dict of the
+    location fcurves of every pose bone, keyed by bone name.
+    """
+    fc_index = {}
+    loc_fcurves = defaultdict(list)
+    for fc in action.fcurves:
+        path = fc.data_path
+        fc_index[(path, fc.array_index)] = fc
+        match = BONE_LOCATION_PATH.fullmatch(path)
+        if match:
+            loc_fcurves[match.group(1)].append(fc)
+    return fc_index, loc_fcurves
+
+def remap_bone_location_fcurves(operator, action, source_bone, target_bone, axis_mapping, replace_all, axis_index=None, fc_index=None, loc_fcurves=None):
+    """Copy the location keyframes of source_bone onto target_bone with axis remapping.
+
+    axis_mapping holds the (target array index, value scale) of each source
+    axis, as returned by get_mapping_settings().
+    When axis_index is set only that source axis is copied.
+    Callers remapping many pairs pass fc_index and loc_fcurves from
+    index_action_fcurves(), new target fcurves are added to both. Without
+    them the few fcurves of a single pair are looked up with fcurves.find().
+    Returns the modified target fcurves, the caller has to update() them.
+    """
+    use_index = fc_index is not None and loc_fcurves is not None
+
+    # Only location is remapped, so the target path is the same for every fcurve
+    target_path = f'pose.bones["{target_bone.name}"].location'
+    modified = set()
+
+    # Only process location keyframes, take a snapshot so target fcurves created
+    # below and added to loc_fcurves don't change what is being iterated
+    if use_index:
+        source_fcurves = tuple(loc_fcurves.get(source_bone.name, ()))
+    else:
+        source_path = f'pose.bones["{source_bone.name}"].location'
+        indices = range(len(axis_mapping)) if axis_index is None else (axis_index,)
+        source_fcurves = [fc for fc in (action.fcurves.find(source_path, index=i) for i in indices) if fc is not None]
+
+    for fcurve in source_fcurves:
+        # Extract the axis index
+        source_axis_index = fcurve.array_index
+        if axis_index is not None and source_axis_index != axis_index:
+            continue
+
+        # Ensure the source_axis_index is within bounds
+        if source_axis_index < 0 or source_axis_index >= len(axis_mapping):
+            operator.report({'WARNING'}, f"Skipping unexpected axis index {source_axis_index}.")
+            continue
+
+        # Map the source axis to the target axis
+        target_axis_index, scale = axis_mapping[source_axis_index]
+
+        # Debugging: Log the mapping
+        if DEBUG:
+            print(f"Mapping {source_bone.name} axis {source_axis_index} to {target_bone.name} axis index {target_axis_index} with scale {scale}.")
+
+        # Create or find the corresponding FCurve for the target bone
+        if use_index:
+            target_fcurve = fc_index.get((target_path, target_axis_index))
+        else:
+            target_fcurve = action.fcurves.find(target_path, index=target_axis_index)
+        if target_fcurve is None:
+            target_fcurve = action.fcurves.new(data_path=target_path, index=target_axis_index)
+            if use_index:
+                fc_index[(target_path, target_axis_index)] = target_fcurve
+                loc_fcurves[target_bone.name].append(target_fcurve)
+
+        # Replace all keyframes if the option is enabled
+        if replace_all:
+            target_fcurve.keyframe_points.clear()
+
+        # Copy keyframe points if they exist
+        count = len(fcurve.keyframe_points)
+        if not count:
+            operator.report({'WARNING'}, f"No keyframe data found for axis index {source_axis_index}. Skipping.")
+            continue
+
+        # Read all keyframes at once and scale the values and handles, each source
+        # axis maps to a single target axis with scale +-1, so only -1 needs the multiply
+        data = copy_keyframe_arrays(fcurve.keyframe_points, 'source')
+        if scale != 1.0:
+            for attr in KEYFRAME_VECTORS:
+                data[attr][1::2] *= scale
+
+        # Keep existing target keys, the ones on matching frames get replaced
+        if len(target_fcurve.keyframe_points):
+            target_data = copy_keyframe_arrays(target_fcurve.keyframe_points, 'target')
+            data = merge_keyframe_arrays(target_data, data)
+            if data is None:
+                # Nothing to do, e.g. the same remap was already run before
+                continue
+
+        # Merged keys end up out of order, update() sorts them into place
+        apply_keyframe_arrays(target_fcurve.keyframe_points, data)
+        modified.add(target_fcurve)
+
+    return modified
+
+def get_source_target_bones(operator, context):
+    """Return the (armature, source, target) of a two bone selection, the active bone is the target.
+
+    Reports the problem on operator and returns None when the selection doesn't fit.
+    """
+    obj = context.object
+    if obj is None or obj.type != 'ARMATURE':
+        operator.report({'ERROR'}, "Active object is not an armature.")
+        return None
+
+    selected_bones = context.selected_pose_bones
+    if not selected_bones or len(selected_bones) != 2:
+        operator.report({'ERROR'}, "Select exactly two bones.")
+        return None
+
+    active_bone = context.active_pose_bone
+    if active_bone not in selected_bones:
+        operator.report({'ERROR'}, "Active bone must be one of the selected bones.")
+        return None
+
+    source_bone = selected_bones[0] if selected_bones[1] == active_bone else selected_bones[1]
+    return obj, source_bone, active_bone
 
 class CopyBoneKeyframesOperator(bpy.types.Operator):
     """Copy keyframes from one bone to another with axis remapping."""
     bl_idname = "object.copy_bone_keyframes"
     bl_label = "Copy Bone Keyframes"
+    bl_options = {'REGISTER', 'UNDO'}
 
     axis: bpy.props.StringProperty(name="Axis")
     use_secondary_mapping: bpy.props.BoolProperty(name="Use Secondary Mapping", default=False)
 
     def execute(self, context):
-        # Get the selected bones
-        obj = context.object
-        if obj is None or obj.type != 'ARMATURE':
-            self.report({'ERROR'}, "Active object is not an armature.")
-            return {'CANCELLED'}
-
-        selected_bones = context.selected_pose_bones
-        if len(selected_bones) != 2:
-            self.report({'ERROR'}, "Select exactly two bones.")
-            return {'CANCELLED'}
-
-        active_bone = context.active_pose_bone
-        if active_bone not in selected_bones:
-            self.report({'ERROR'}, "Active bone must be one of the selected bones.")
+        selection = get_source_target_bones(self, context)
+        if selection is None:
             return {'CANCELLED'}
-
-        # Determine source and target bones
-        source_bone = selected_bones[0] if selected_bones[1] == active_bone else selected_bones[1]
-        target_bone = active_bone
+        obj, source_bone, target_bone = selection
 
         # Get axis mapping from the UI
-        axis_mapping = {
-            'X+': (0, 1), 'X-': (0, -1), 'Y+': (1, 1), 'Y-': (1, -1), 'Z+': (2, 1), 'Z-': (2, -1)
-        }
-
-        if self.use_secondary_mapping:
-            source_axes = [
-                context.scene.secondary_x_axis,
-                context.scene.secondary_y_axis,
-                context.scene.secondary_z_axis
-            ]
-            replace_all = context.scene.secondary_replace_all_keyframes
-        else:
-            source_axes = [
-                context.scene.source_x_axis,
-                context.scene.source_y_axis,
-                context.scene.source_z_axis
-            ]
-            replace_all = context.scene.replace_all_keyframes
+        axis_mapping, replace_all = get_mapping_settings(context.scene.psychos_helpers, self.use_secondary_mapping)
 
         # Copy keyframes with remapping
-        action = obj.animation_data.action
+        action = obj.animation_data.action if obj.animation_data else None
         if action is None:
             self.report({'ERROR'}, "No animation data found.")
             return {'CANCELLED'}
 
-        for fcurve in action.fcurves:
-            # Only process location keyframes
-            if not fcurve.data_path.startswith(f'pose.bones["{source_bone.name}"].location'):
-                continue
-
-            # Extract the property and axis index
-            property_name = fcurve.data_path.split('.')[-1]
-            source_axis_index = fcurve.array_index
-
-            # Ensure the source_axis_index is within bounds
-            if source_axis_index < 0 or source_axis_index >= len(source_axes):
-                self.report({'WARNING'}, f"Skipping unexpected axis index {source_axis_index}.")
-                continue
-
-            # Map the source axis to the target axis
-            target_axis = source_axes[source_axis_index]
-            if target_axis not in axis_mapping:
-                self.report({'WARNING'}, f"Invalid axis mapping: {target_axis}.")
-                continue
-
-            target_axis_index, scale = axis_mapping[target_axis]
-
-            # Debugging: Log the mapping
-            self.report({'INFO'}, f"Mapping source axis {source_axis_index} ({target_axis}) to target axis index {target_axis_index} with scale {scale}.")
-
-            # Create or find the corresponding FCurve for the target bone
-            target_path = f'pose.bones["{target_bone.name}"].{property_name}'
-            target_fcurve = next((fc for fc in action.fcurves if fc.data_path == target_path and fc.array_index == target_axis_index), None)
-            if target_fcurve is None:
-                target_fcurve = action.fcurves.new(data_path=target_path, index=target_axis_index)
-
-            # Replace all keyframes if the option is enabled
-            if replace_all:
-                target_fcurve.keyframe_points.clear()
-
-            # Copy keyframe points if they exist
-            if not fcurve.keyframe_points:
-                self.report({'WARNING'}, f"No keyframe data found for axis index {source_axis_index}. Skipping.")
-                continue
-
-            for keyframe in fcurve.keyframe_points:
-                scaled_value = keyframe.co[1] * scale
-                self.report({'INFO'}, f"Source keyframe at frame {keyframe.co[0]} with value {keyframe.co[1]} scaled to {scaled_value}.")
-                target_fcurve.keyframe_points.insert(keyframe.co[0], scaled_value)
-                self.report({'INFO'}, f"Target keyframe at frame {keyframe.co[0]} set to value {scaled_value} on axis index {target_axis_index}.")
+        # Only copy the requested source axis, no axis means all of them
+        axis_index = {'X': 0, 'Y': 1, 'Z': 2}.get(self.axis)
+        modified = remap_bone_location_fcurves(self, action, source_bone, target_bone, axis_mapping, replace_all, axis_index)
+        for fcurve in modified:
+            fcurve.update()
 
         self.report({'INFO'}, f"Keyframes for axis {self.axis} copied successfully!")
         return {'FINISHED'}
@@ -122,33 +213,27 @@ class CopyAllAxesKeyframesOperator(bpy.types.Operator):
     """Copy keyframes for all axes from one bone to another."""
     bl_idname = "object.copy_all_axes_keyframes"
     bl_label = "Copy All Axes Keyframes"
+    bl_options = {'REGISTER', 'UNDO'}
 
     use_secondary_mapping: bpy.props.BoolProperty(name="Use Secondary Mapping", default=False)
 
     def execute(self, context):
-        # Get the selected bones
-        obj = context.object
-        if obj is None or obj.type != 'ARMATURE':
-            self.report({'ERROR'}, "Active object is not an armature.")
+        selection = get_source_target_bones(self, context)
+        if selection is None:
             return {'CANCELLED'}
+        obj, source_bone, target_bone = selection
 
-        selected_bones = context.selected_pose_bones
-        if len(selected_bones) != 2:
-            self.report({'ERROR'}, "Select exactly two bones.")
-            return {'CANCELLED'}
+        axis_mapping, replace_all = get_mapping_settings(context.scene.psychos_helpers, self.use_secondary_mapping)
 
-        active_bone = context.active_pose_bone
-        if active_bone not in selected_bones:
-            self.report({'ERROR'}, "Active bone must be one of the selected bones.")
+        action = obj.animation_data.action if obj.animation_data else None
+        if action is None:
+            self.report({'ERROR'}, "No animation data found.")
             return {'CANCELLED'}
 
-        # Determine source and target bones
-        source_bone = selected_bones[0] if selected_bones[1] == active_bone else selected_bones[1]
-        target_bone = active_bone
-
-        # Copy keyframes for all axes
-        for axis in ['X', 'Y', 'Z']:
-            bpy.ops.object.copy_bone_keyframes(axis=axis, use_secondary_mapping=self.use_secondary_mapping)
+        # Copy keyframes for all axes in a single pass
+        modified = remap_bone_location_fcurves(self, action, source_bone, target_bone, axis_mapping, replace_all)
+        for fcurve in modified:
+            fcurve.update()
 
         self.report({'INFO'}, "Keyframes for all axes copied successfully!")
         return {'FINISHED'}
@@ -163,24 +248,25 @@ class CopyBoneKeyframesPanel(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
+        settings = context.scene.psychos_helpers
 
         # Primary Mapping Section
         layout.label(text="Primary Mapping:")
         row = layout.row()
         row.label(text="Source Mapper:")
-        row.prop(context.scene, "primary_mapper", text="")
-        #row.prop(context.scene, "primary_suffix", text="Suffix")
+        row.prop(settings, "primary_mapper", text="")
+        #row.prop(settings, "primary_suffix", text="Suffix")
 
         row = layout.row()
         row.label(text="Source X+ > Target:")
-        row.prop(context.scene, "source_x_axis", text="")
+        row.prop(settings, "source_x_axis", text="")
         row = layout.row()
         row.label(text="Source Y+ > Target:")
-        row.prop(context.scene, "source_y_axis", text="")
+        row.prop(settings, "source_y_axis", text="")
         row = layout.row()
         row.label(text="Source Z+ > Target:")
-        row.prop(context.scene, "source_z_axis", text="")
-        layout.prop(context.scene, "replace_all_keyframes", text="Replace All Keyframes")
+        row.prop(settings, "source_z_axis", text="")
+        layout.prop(settings, "replace_all_keyframes", text="Replace All Keyframes")
 
         row = layout.row()
         row.operator("object.copy_bone_keyframes", text="Copy X Axis").axis = "X"
@@ -194,32 +280,33 @@ class CopyBoneKeyframesPanel(bpy.types.Panel):
         layout.label(text="Secondary Mapping:")
         row = layout.row()
         row.label(text="Source Mapper:")
-        row.prop(context.scene, "secondary_mapper", text="")
-        #row.prop(context.scene, "secondary_suffix", text="Suffix")
+        row.prop(settings, "secondary_mapper", text="")
+        #row.prop(settings, "secondary_suffix", text="Suffix")
 
         row = layout.row()
         row.label(text="Source X+ > Target:")
-        row.prop(context.scene, "secondary_x_axis", text="")
+        row.prop(settings, "secondary_x_axis", text="")
         row = layout.row()
         row.label(text="Source Y+ > Target:")
-        row.prop(context.scene, "secondary_y_axis", text="")
+        row.prop(settings, "secondary_y_axis", text="")
         row = layout.row()
         row.label(text="Source Z+ > Target:")
-        row.prop(context.scene, "secondary_z_axis", text="")
-        layout.prop(context.scene, "secondary_replace_all_keyframes", text="Replace All Keyframes")
+        row.prop(settings, "secondary_z_axis", text="")
+        layout.prop(settings, "secondary_replace_all_keyframes", text="Replace All Keyframes")
 
         # Ensure secondary buttons apply secondary mapping
         row = layout.row()
-        row.operator("object.copy_bone_keyframes", text="Copy X Axis").use_secondary_mapping = True
-        row.operator("object.copy_bone_keyframes", text="Copy Y Axis").use_secondary_mapping = True
-        row.operator("object.copy_bone_keyframes", text="Copy Z Axis").use_secondary_mapping = True
+        for axis in "XYZ":
+            op = row.operator("object.copy_bone_keyframes", text=f"Copy {axis} Axis")
+            op.axis = axis
+            op.use_secondary_mapping = True
 
         # Ensure 'Copy All Axes' uses secondary mapping
         layout.operator("object.copy_all_axes_keyframes", text="Copy All Axes").use_secondary_mapping = True
 
         # Duplicate/Target suffix
         row = layout.row()
-        layout.prop(context.scene, "primary_suffix", text="Target Suffix")
+        layout.prop(settings, "primary_suffix", text="Target Suffix")
 
         # Remap All Button
         row = layout.row()
@@ -235,21 +322,9 @@ class SwapAndFlipKeyframesPanel(bpy.types.Panel):
     #bl_category = 'Psycho''s Helpers'
     bl_category = 'Item'
 
-    """
-    def draw(self, context):
-        layout = self.layout
-        row = layout.row()
-        row.operator("object.XXX", text="Flip X Loc")
-        row.operator("object.XXX", text="Flip X Rot")
-        row = layout.row()
-        row.operator("object.XXX", text="Flip Y Loc")
-        row.operator("object.XXX", text="Flip Y Rot")
-        row = layout.row()
-        row.operator("object.XXX", text="Flip Z Loc")
-        row.operator("object.XXX", text="Flip Z Rot")
-    """
     def draw(self, context):
         layout = self.layout
+        settings = context.scene.psychos_helpers
         row = layout.row()
         for axis, label in enumerate("XYZ"):
             row = layout.row()
@@ -296,7 +371,7 @@ class SwapAndFlipKeyframesPanel(bpy.types.Panel):
 
         row = layout.row()
         row = layout.row()
-        layout.prop(context.scene, "use_quaternion_rotation", text="Use Quaternions")
+        layout.prop(settings, "use_quaternion_rotation", text="Use Quaternions")
 
         layout.label(text="Direct Copy (Location):")
         row = layout.row()
@@ -319,15 +394,16 @@ class SwapAndFlipKeyframesPanel(bpy.types.Panel):
 
         layout.label(text="45° Scaling (Location):")
         row = layout.row()
-        row.prop(context.scene, "use_x_45d")
-        row.prop(context.scene, "use_y_45d")
-        row.prop(context.scene, "use_z_45d")
+        row.prop(settings, "use_x_45d")
+        row.prop(settings, "use_y_45d")
+        row.prop(settings, "use_z_45d")
         layout.operator("object.calc_45d_scale", text="Calc 45°")
 
 class CopyAxisToAxisOperator(bpy.types.Operator):
     """Copy keyframes from one axis to another for the active bone"""
     bl_idname = "object.copy_axis_to_axis"
     bl_label = "Copy Axis → Axis"
+    bl_options = {'REGISTER', 'UNDO'}
 
     source_axis: bpy.props.IntProperty()
     target_axis: bpy.props.IntProperty()
@@ -349,23 +425,18 @@ class CopyAxisToAxisOperator(bpy.types.Operator):
             return {'CANCELLED'}
 
         data_path = f'pose.bones["{pose_bone.name}"].location'
-        fcurve_src = next((fc for fc in action.fcurves if fc.data_path == data_path and fc.array_index == self.source_axis), None)
+        fcurve_src = action.fcurves.find(data_path, index=self.source_axis)
         if not fcurve_src:
             self.report({'WARNING'}, f"No source keyframes found for axis {self.source_axis}.")
             return {'CANCELLED'}
 
-        fcurve_tgt = next((fc for fc in action.fcurves if fc.data_path == data_path and fc.array_index == self.target_axis), None)
+        fcurve_tgt = action.fcurves.find(data_path, index=self.target_axis)
         if not fcurve_tgt:
             fcurve_tgt = action.fcurves.new(data_path=data_path, index=self.target_axis)
 
-        # clear old keys on target
-        fcurve_tgt.keyframe_points.clear()
-
-        # copy with handles
-        for kp in fcurve_src.keyframe_points:
-            data = copy_keyframe_data(kp)
-            kp_new = fcurve_tgt.keyframe_points.insert(data['co'][0], data['co'][1])
-            apply_keyframe_data(kp_new, data)
+        # copy with handles, replacing the old keys on target
+        data = copy_keyframe_arrays(fcurve_src.keyframe_points, 'source')
+        apply_keyframe_arrays(fcurve_tgt.keyframe_points, data)
 
         fcurve_tgt.update()
         self.report({'INFO'}, f"Copied axis {self.source_axis} → {self.target_axis} for {pose_bone.name}")
@@ -375,6 +446,7 @@ class FlipKeyframeAxisOperator(bpy.types.Operator):
     """Flip Keyframe Curve Values for a Specific Axis and Property"""
     bl_idname = "object.flip_keyframe_axis"
     bl_label = "Flip Keyframe Axis"
+    bl_options = {'REGISTER', 'UNDO'}
     
     property: bpy.props.StringProperty()  # 'location', 'rotation', or 'scale'
     axis: bpy.props.IntProperty()         # 0=X, 1=Y, 2=Z
@@ -399,7 +471,7 @@ class FlipKeyframeAxisOperator(bpy.types.Operator):
         prop = self.property
         axis = self.axis
         if prop == "rotation":
-            if context.scene.use_quaternion_rotation:
+            if context.scene.psychos_helpers.use_quaternion_rotation:
                 prop = "rotation_quaternion"
                 # remap Euler X,Y,Z -> Quaternion X,Y,Z (skip W)
                 axis_map = {0: 1, 1: 2, 2: 3}
@@ -409,17 +481,13 @@ class FlipKeyframeAxisOperator(bpy.types.Operator):
 
         data_path = f'pose.bones["{pose_bone.name}"].{prop}'
         
-        fcurve = next((fc for fc in action.fcurves 
-                       if fc.data_path == data_path and fc.array_index == axis), None)
+        fcurve = action.fcurves.find(data_path, index=axis)
 
         if not fcurve:
             self.report({'WARNING'}, f"No keyframes found for {prop} axis {axis}.")
             return {'CANCELLED'}
 
-        for kp in fcurve.keyframe_points:
-            kp.co[1] *= -1  # Flip the value
-            kp.handle_left[1] *= -1
-            kp.handle_right[1] *= -1
+        scale_keyframe_values(fcurve.keyframe_points, -1.0)  # Flip the values
 
         fcurve.update()
         self.report({'INFO'}, f"Flipped {prop} axis {axis} keyframes for {pose_bone.name}")
@@ -431,6 +499,7 @@ class Calc45dScaleOperator(bpy.types.Operator):
     """Scale selected location axes so combined motion keeps same distance (45° / n-axes)"""
     bl_idname = "object.calc_45d_scale"
     bl_label = "Calc 45° Scaling"
+    bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
         obj = context.object
@@ -449,10 +518,11 @@ class Calc45dScaleOperator(bpy.types.Operator):
             return {'CANCELLED'}
 
         # Which axes are enabled
+        settings = context.scene.psychos_helpers
         axes = []
-        if context.scene.use_x_45d: axes.append(0)
-        if context.scene.use_y_45d: axes.append(1)
-        if context.scene.use_z_45d: axes.append(2)
+        if settings.use_x_45d: axes.append(0)
+        if settings.use_y_45d: axes.append(1)
+        if settings.use_z_45d: axes.append(2)
 
         if len(axes) < 2:
             self.report({'WARNING'}, "Pick at least 2 axes to apply 45° scaling.")
@@ -460,17 +530,17 @@ class Calc45dScaleOperator(bpy.types.Operator):
 
         scale = 1.0 / math.sqrt(len(axes))
 
+        modified = set()
+        data_path = f'pose.bones["{pose_bone.name}"].location'
         for axis in axes:
-            data_path = f'pose.bones["{pose_bone.name}"].location'
-            fcurve = next((fc for fc in action.fcurves 
-                          if fc.data_path == data_path and fc.array_index == axis), None)
+            fcurve = action.fcurves.find(data_path, index=axis)
             if not fcurve:
                 continue
 
-            for kp in fcurve.keyframe_points:
-                kp.co[1] *= scale
-                kp.handle_left[1] *= scale
-                kp.handle_right[1] *= scale
+            scale_keyframe_values(fcurve.keyframe_points, scale)
+            modified.add(fcurve)
+
+        for fcurve in modified:
             fcurve.update()
 
         self.report({'INFO'}, f"Scaled {len(axes)} axes by {scale:.4f} for 45° motion.")
@@ -480,6 +550,7 @@ class RemapAllBonesOperator(bpy.types.Operator):
     """Remap all bones based on mapper and suffix rules."""
     bl_idname = "object.remap_all_bones"
     bl_label = "Remap All Bones"
+    bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
         obj = context.object
@@ -493,144 +564,61 @@ class RemapAllBonesOperator(bpy.types.Operator):
             return {'CANCELLED'}
 
         # Retrieve mapper and suffix keywords
-        primary_mapper = context.scene.primary_mapper
-        primary_suffix = context.scene.primary_suffix
-        secondary_mapper = context.scene.secondary_mapper
-        #secondary_suffix = context.scene.secondary_suffix
+        settings = context.scene.psychos_helpers
+        primary_mapper = settings.primary_mapper
+        primary_suffix = settings.primary_suffix
+        secondary_mapper = settings.secondary_mapper
+        #secondary_suffix = settings.secondary_suffix
         secondary_suffix = primary_suffix
 
+        # name[:-0] is an empty string, an empty suffix would pair nothing
+        if not primary_suffix:
+            self.report({'ERROR'}, "Primary suffix is empty.")
+            return {'CANCELLED'}
+
         # Pair bones based on suffix exclusion
+        selected_by_name = {bone.name: bone for bone in selected_bones}
+        suffix_len = len(primary_suffix)
         bone_pairs = []
         for bone in selected_bones:
             if bone.name.endswith(primary_suffix):
-                base_name = bone.name[:-len(primary_suffix)]
-                source_bone = obj.pose.bones.get(base_name)
-                if source_bone and source_bone in selected_bones:
+                source_bone = selected_by_name.get(bone.name[:-suffix_len])
+                if source_bone is not None:
                     bone_pairs.append((source_bone, bone))
 
-        # Debugging: Print paired bones
         if not bone_pairs:
             self.report({'WARNING'}, "No valid bone pairs found.")
             return {'CANCELLED'}
 
-        """
-        for source_bone, target_bone in bone_pairs:
-            print(f"Pairing source: {source_bone.name} -> target: {target_bone.name}")
-        """
         # Copy keyframes for each pair
-        """
         action = obj.animation_data.action if obj.animation_data else None
         if action is None:
             self.report({'ERROR'}, "No animation data found.")
             return {'CANCELLED'}
-        """
-        for source_bone, target_bone in bone_pairs:
-            """
-            for fcurve in action.fcurves:
-                if not fcurve.data_path.startswith(f'pose.bones["{source_bone.name}"].location'):
-                    continue
-
-                property_name = fcurve.data_path.split('.')[-1]
-                source_axis_index = fcurve.array_index
-
-                target_path = f'pose.bones["{target_bone.name}"].{property_name}'
-                target_fcurve = next((fc for fc in action.fcurves if fc.data_path == target_path and fc.array_index == source_axis_index), None)
-                if target_fcurve is None:
-                    try:
-                        target_fcurve = action.fcurves.new(data_path=target_path, index=source_axis_index)
-                    except Exception as e:
-                        self.report({'WARNING'}, f"Failed to create FCurve for {target_path}: {e}")
-                        continue
-
-                try:
-                    target_fcurve.keyframe_points.clear()
-                except Exception as e:
-                    self.report({'WARNING'}, f"Failed to clear keyframes for {target_path}: {e}")
-                    continue
-
-                if not fcurve.keyframe_points:
-                    self.report({'WARNING'}, f"No keyframe data found for {fcurve.data_path}. Skipping.")
-                    continue
 
-                for keyframe in fcurve.keyframe_points:
-                    try:
-                        target_fcurve.keyframe_points.insert(keyframe.co[0], keyframe.co[1])
-                    except Exception as e:
-                        self.report({'WARNING'}, f"Failed to insert keyframe at frame {keyframe.co[0]} for {target_path}: {e}")
-                        continue
-"""
-            # Get axis mapping from the UI
-            axis_mapping = {
-                'X+': (0, 1), 'X-': (0, -1), 'Y+': (1, 1), 'Y-': (1, -1), 'Z+': (2, 1), 'Z-': (2, -1)
-            }
-
-            if secondary_mapper in source_bone.name:
-                source_axes = [
-                    context.scene.secondary_x_axis,
-                    context.scene.secondary_y_axis,
-                    context.scene.secondary_z_axis
-                ]
-                replace_all = context.scene.secondary_replace_all_keyframes
-            else:
-                source_axes = [
-                    context.scene.source_x_axis,
-                    context.scene.source_y_axis,
-                    context.scene.source_z_axis
-                ]
-                replace_all = context.scene.replace_all_keyframes
-
-            # Copy keyframes with remapping
-            action = obj.animation_data.action
-            if action is None:
-                self.report({'ERROR'}, "No animation data found.")
-                return {'CANCELLED'}
-
-            for fcurve in action.fcurves:
-                # Only process location keyframes !!! LIKES TO CRASH BLENDER ON SOME ANIMATIONS FOR SOME REASON !!!
-                if not fcurve.data_path.startswith(f'pose.bones["{source_bone.name}"].location'):
-                    continue
+        # One fcurve index shared by all pairs, new target fcurves get added to it
+        fc_index, loc_fcurves = index_action_fcurves(action)
 
-                # Extract the property and axis index
-                property_name = fcurve.data_path.split('.')[-1]
-                source_axis_index = fcurve.array_index
+        # The mappings are the same for every pair, only read them once
+        primary_settings = get_mapping_settings(settings, False)
+        secondary_settings = get_mapping_settings(settings, True)
 
-                # Ensure the source_axis_index is within bounds
-                if source_axis_index < 0 or source_axis_index >= len(source_axes):
-                    self.report({'WARNING'}, f"Skipping unexpected axis index {source_axis_index}.")
-                    continue
+        modified = set()
 
-                # Map the source axis to the target axis
-                target_axis = source_axes[source_axis_index]
-                if target_axis not in axis_mapping:
-                    self.report({'WARNING'}, f"Invalid axis mapping: {target_axis}.")
-                    continue
-
-                target_axis_index, scale = axis_mapping[target_axis]
-
-                # Debugging: Log the mapping
-                self.report({'INFO'}, f"Mapping source axis {source_axis_index} ({target_axis}) to target axis index {target_axis_index} with scale {scale}.")
-
-                # Create or find the corresponding FCurve for the target bone
-                target_path = f'pose.bones["{target_bone.name}"].{property_name}'
-                target_fcurve = next((fc for fc in action.fcurves if fc.data_path == target_path and fc.array_index == target_axis_index), None)
-                if target_fcurve is None:
-                    target_fcurve = action.fcurves.new(data_path=target_path, index=target_axis_index)
+        for source_bone, target_bone in bone_pairs:
+            # Nothing to remap for bones without location keys, e.g. rotation-only or IK bones
+            if not loc_fcurves.get(source_bone.name):
+                continue
 
-                # Replace all keyframes if the option is enabled
-                if replace_all:
-                    target_fcurve.keyframe_points.clear()
+            # Get axis mapping from the UI
+            axis_mapping, replace_all = secondary_settings if secondary_mapper in source_bone.name else primary_settings
 
-                # Copy keyframe points if they exist
-                if not fcurve.keyframe_points:
-                    self.report({'WARNING'}, f"No keyframe data found for axis index {source_axis_index}. Skipping.")
-                    continue
+            modified |= remap_bone_location_fcurves(self, action, source_bone, target_bone, axis_mapping, replace_all, fc_index=fc_index, loc_fcurves=loc_fcurves)
 
-                for keyframe in fcurve.keyframe_points:
-                    scaled_value = keyframe.co[1] * scale
-                    self.report({'INFO'}, f"Source keyframe at frame {keyframe.co[0]} with value {keyframe.co[1]} scaled to {scaled_value}.")
-                    target_fcurve.keyframe_points.insert(keyframe.co[0], scaled_value)
-                    self.report({'INFO'}, f"Target keyframe at frame {keyframe.co[0]} set to value {scaled_value} on axis index {target_axis_index}.")
-        self.report({'INFO'}, "Remap All completed successfully.")
+        # Sort and recalculate handles once per fcurve after all pairs are done
+        for fcurve in modified:
+            fcurve.update()
+        self.report({'INFO'}, f"Remap All completed successfully for {len(bone_pairs)} bone pairs.")
         return {'FINISHED'}
 
 # Add to right-click context menu in Pose Mode
@@ -639,24 +627,98 @@ def pose_context_menu(self, context):
         self.layout.separator()
         self.layout.operator("object.swap_keyframes", icon='ARROW_LEFTRIGHT')
 
-def copy_keyframe_data(kp):
-    return {
-        'co': kp.co[:],
-        'handle_left': kp.handle_left[:],
-        'handle_right': kp.handle_right[:],
-        'interpolation': kp.interpolation,
-        'easing': kp.easing,
-        'handle_left_type': kp.handle_left_type,
-        'handle_right_type': kp.handle_right_type,
-    }
-
-def apply_keyframe_data(kp, data):
-    kp.handle_left = data['handle_left']
-    kp.handle_right = data['handle_right']
-    kp.interpolation = data['interpolation']
-    kp.easing = data['easing']
-    kp.handle_left_type = data['handle_left_type']
-    kp.handle_right_type = data['handle_right_type']
+# Keyframe attributes moved in bulk, 2D vectors are stored flat as [x, y, x, y, ...]
+KEYFRAME_VECTORS = ('co', 'handle_left', 'handle_right')
+KEYFRAME_ENUMS = ('interpolation', 'easing', 'handle_left_type', 'handle_right_type')
+
+# Reusable numpy buffers, only reallocated when a bigger fcurve comes along
+scratch_buffers = {}
+
+def get_scratch_buffer(name, size, dtype=np.float32):
+    """Return a view of size items on the reusable buffer called name."""
+    buf = scratch_buffers.get(name)
+    if buf is None or buf.size < size or buf.dtype != dtype:
+        buf = np.empty(size, dtype=dtype)
+        scratch_buffers[name] = buf
+    return buf[:size]
+
+def copy_keyframe_arrays(keyframe_points, slot):
+    """Read all keyframes of an fcurve into numpy arrays with foreach_get.
+
+    The arrays live in scratch buffers named after slot and stay valid until
+    the next read into the same slot.
+    """
+    count = len(keyframe_points)
+    data = {}
+    for attr in KEYFRAME_VECTORS:
+        data[attr] = get_scratch_buffer(f"{slot}_{attr}", count * 2)
+        keyframe_points.foreach_get(attr, data[attr])
+    for attr in KEYFRAME_ENUMS:
+        data[attr] = get_scratch_buffer(f"{slot}_{attr}", count, np.int32)
+        keyframe_points.foreach_get(attr, data[attr])
+    return data
+
+def scale_keyframe_values(keyframe_points, factor):
+    """Multiply the value of every keyframe and its handles by factor."""
+    buf = get_scratch_buffer('scale', len(keyframe_points) * 2)
+    # Handles first and co last, auto handles are then recalculated once by fcurve.update()
+    for attr in ('handle_left', 'handle_right', 'co'):
+        keyframe_points.foreach_get(attr, buf)
+        buf[1::2] *= factor
+        keyframe_points.foreach_set(attr, buf)
+
+def match_keyframe_frames(frames, source_frames):
+    """Find the nearest key in the sorted frames of every source frame.
+
+    Returns the nearest indices and a mask of the ones within 0.01 frames.
+    """
+    last = len(frames) - 1
+    pos = np.searchsorted(frames, source_frames)
+    left = np.clip(pos - 1, 0, last)
+    right = np.clip(pos, 0, last)
+    use_left = np.abs(frames[left] - source_frames) <= np.abs(frames[right] - source_frames)
+    nearest = np.where(use_left, left, right)
+    # float32 threshold, the same 0.01f keyframe_points.insert() uses
+    matched = np.abs(frames[nearest] - source_frames) < np.float32(0.01)
+    return nearest, matched
+
+def merge_keyframe_arrays(target, source):
+    """Merge source keyframe arrays into the arrays of the existing target keys.
+
+    Target keys within 0.01 frames of a source key are replaced by it, like
+    keyframe_points.insert() does, the other source keys are appended.
+    Returns the merged arrays, or None when the target already has all
+    source keys unchanged.
+    """
+    target_frames = target['co'][0::2]
+    source_frames = source['co'][0::2]
+    # Appended keys are only sorted by fcurve.update(), don't rely on the order
+    order = np.argsort(target_frames, kind='stable')
+    frames = target_frames[order]
+
+    # Nearest target key of every source key
+    nearest, matched = match_keyframe_frames(frames, source_frames)
+    matched_rows = order[nearest[matched]]
+    added = ~matched
+
+    changed = bool(added.any())
+    merged = {}
+    for attr, values in target.items():
+        width = 2 if attr in KEYFRAME_VECTORS else 1
+        rows = values.reshape(-1, width)
+        source_rows = source[attr].reshape(-1, width)
+        if not changed and not np.array_equal(rows[matched_rows], source_rows[matched]):
+            changed = True
+        rows[matched_rows] = source_rows[matched]
+        merged[attr] = np.concatenate((rows, source_rows[added])).ravel()
+    return merged if changed else None
+
+def apply_keyframe_arrays(keyframe_points, data):
+    """Replace all keyframes of an fcurve with arrays from copy_keyframe_arrays()."""
+    keyframe_points.clear()
+    keyframe_points.add(len(data['co']) // 2)
+    for attr, values in data.items():
+        keyframe_points.foreach_set(attr, values)
 
 class SwapKeyframesOperator(bpy.types.Operator):
     """Swap keyframes between two selected pose bones"""
@@ -665,24 +727,10 @@ class SwapKeyframesOperator(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        obj = context.object
-        if not obj or obj.type != 'ARMATURE':
-            self.report({'ERROR'}, "Active object is not an armature.")
+        selection = get_source_target_bones(self, context)
+        if selection is None:
             return {'CANCELLED'}
-
-        bones = context.selected_pose_bones
-        if not bones or len(bones) != 2:
-            self.report({'ERROR'}, "Select exactly two bones.")
-            return {'CANCELLED'}
-
-        active_bone = context.active_pose_bone
-        if active_bone not in bones:
-            self.report({'ERROR'}, "Active bone must be one of the selected bones.")
-            return {'CANCELLED'}
-
-        # Define bones
-        source_bone = bones[0] if bones[1] == active_bone else bones[1]
-        target_bone = active_bone
+        obj, source_bone, target_bone = selection
 
         # Animation check
         if not obj.animation_data or not obj.animation_data.action:
@@ -694,61 +742,31 @@ class SwapKeyframesOperator(bpy.types.Operator):
         # Store fcurves to process
         transform_properties = ['location', 'rotation_euler', 'rotation_quaternion', 'scale']
 
+        modified = set()
         for prop in transform_properties:
             for axis_index in range(3 if prop != 'rotation_quaternion' else 4):
                 source_path = f'pose.bones["{source_bone.name}"].{prop}'
                 target_path = f'pose.bones["{target_bone.name}"].{prop}'
 
-                source_fcurve = next((fc for fc in action.fcurves
-                                      if fc.data_path == source_path and fc.array_index == axis_index), None)
-                target_fcurve = next((fc for fc in action.fcurves
-                                      if fc.data_path == target_path and fc.array_index == axis_index), None)
-
-                # Store keyframes
-                source_data = [copy_keyframe_data(kp) for kp in source_fcurve.keyframe_points] if source_fcurve else []
-                target_data = [copy_keyframe_data(kp) for kp in target_fcurve.keyframe_points] if target_fcurve else []
-
-                # Ensure fcurves exist
-                """
-                if not source_fcurve:
-                    source_fcurve = action.fcurves.new(data_path=source_path, index=axis_index)
-                else:
-                    source_fcurve.keyframe_points.clear()
-
-                if not target_fcurve:
-                    target_fcurve = action.fcurves.new(data_path=target_path, index=axis_index)
-                else:
-                    target_fcurve.keyframe_points.clear()
-
-                # Apply swapped keyframes
-                for data in source_data:
-                    kp = target_fcurve.keyframe_points.insert(data['co'][0], data['co'][1])
-                    apply_keyframe_data(kp, data)
-
-                for data in target_data:
-                    kp = source_fcurve.keyframe_points.insert(data['co'][0], data['co'][1])
-                    apply_keyframe_data(kp, data)
-                """
+                source_fcurve = action.fcurves.find(source_path, index=axis_index)
+                target_fcurve = action.fcurves.find(target_path, index=axis_index)
 
                 if not source_fcurve or not target_fcurve:
                     # Skip this axis/property entirely if either FCurve is missing
                     continue
 
                 # Copy keyframes before clearing
-                source_data = [copy_keyframe_data(kp) for kp in source_fcurve.keyframe_points]
-                target_data = [copy_keyframe_data(kp) for kp in target_fcurve.keyframe_points]
+                source_data = copy_keyframe_arrays(source_fcurve.keyframe_points, 'source')
+                target_data = copy_keyframe_arrays(target_fcurve.keyframe_points, 'target')
 
                 # Clear and swap
-                source_fcurve.keyframe_points.clear()
-                target_fcurve.keyframe_points.clear()
+                apply_keyframe_arrays(target_fcurve.keyframe_points, source_data)
+                apply_keyframe_arrays(source_fcurve.keyframe_points, target_data)
 
-                for data in source_data:
-                    kp = target_fcurve.keyframe_points.insert(data['co'][0], data['co'][1])
-                    apply_keyframe_data(kp, data)
+                modified.update((source_fcurve, target_fcurve))
 
-                for data in target_data:
-                    kp = source_fcurve.keyframe_points.insert(data['co'][0], data['co'][1])
-                    apply_keyframe_data(kp, data)
+        for fcurve in modified:
+            fcurve.update()
 
         self.report({'INFO'}, f"Swapped keyframes between '{source_bone.name}' and '{target_bone.name}'.")
         return {'FINISHED'}
@@ -757,6 +775,7 @@ class SwapKeyframeAxisOperator(bpy.types.Operator):
     """Swap keyframes between two axes of the same property"""
     bl_idname = "object.swap_keyframe_axis"
     bl_label = "Swap Axis Keyframes"
+    bl_options = {'REGISTER', 'UNDO'}
 
     property: bpy.props.StringProperty(default="location")  # default = location
     axis_a: bpy.props.IntProperty()
@@ -781,7 +800,7 @@ class SwapKeyframeAxisOperator(bpy.types.Operator):
         # Decide rotation type
         prop = self.property
         if prop == "rotation":
-            if context.scene.use_quaternion_rotation:
+            if context.scene.psychos_helpers.use_quaternion_rotation:
                 prop = "rotation_quaternion"
                 # remap indices: Euler (0,1,2) → Quaternion (1,2,3)
                 axis_map = {0: 1, 1: 2, 2: 3}
@@ -795,27 +814,19 @@ class SwapKeyframeAxisOperator(bpy.types.Operator):
 
         data_path = f'pose.bones["{pose_bone.name}"].{prop}'
 
-        fcurve_a = next((fc for fc in action.fcurves if fc.data_path == data_path and fc.array_index == axis_a), None)
-        fcurve_b = next((fc for fc in action.fcurves if fc.data_path == data_path and fc.array_index == axis_b), None)
+        fcurve_a = action.fcurves.find(data_path, index=axis_a)
+        fcurve_b = action.fcurves.find(data_path, index=axis_b)
 
         if not fcurve_a or not fcurve_b:
             self.report({'WARNING'}, f"No keyframes found for {prop} axes {self.axis_a}, {self.axis_b}.")
             return {'CANCELLED'}
 
-        # --- NEW: Use helper functions to preserve full keyframe data ---
-        a_data = [copy_keyframe_data(kp) for kp in fcurve_a.keyframe_points]
-        b_data = [copy_keyframe_data(kp) for kp in fcurve_b.keyframe_points]
-
-        fcurve_a.keyframe_points.clear()
-        fcurve_b.keyframe_points.clear()
-
-        for data in b_data:
-            kp = fcurve_a.keyframe_points.insert(data['co'][0], data['co'][1])
-            apply_keyframe_data(kp, data)
+        # Read both axes with their full keyframe data before overwriting either
+        a_data = copy_keyframe_arrays(fcurve_a.keyframe_points, 'source')
+        b_data = copy_keyframe_arrays(fcurve_b.keyframe_points, 'target')
 
-        for data in a_data:
-            kp = fcurve_b.keyframe_points.insert(data['co'][0], data['co'][1])
-            apply_keyframe_data(kp, data)
+        apply_keyframe_arrays(fcurve_a.keyframe_points, b_data)
+        apply_keyframe_arrays(fcurve_b.keyframe_points, a_data)
 
         fcurve_a.update()
         fcurve_b.update()
@@ -826,166 +837,124 @@ class SwapKeyframeAxisOperator(bpy.types.Operator):
 
 
 
-# Register and Unregister
-classes = [
-    CopyBoneKeyframesOperator,
-    CopyAllAxesKeyframesOperator,
-    CopyBoneKeyframesPanel,
-    SwapAndFlipKeyframesPanel,
-    FlipKeyframeAxisOperator,
-    RemapAllBonesOperator,
-    SwapKeyframesOperator,
-    SwapKeyframeAxisOperator,
-    Calc45dScaleOperator,
-    CopyAxisToAxisOperator,
-]
+# Target axis choices shared by all axis mapping enums, same keys as AXIS_MAPPING
+AXIS_ITEMS = (
+    ('X+', "X+", ""),
+    ('X-', "X-", ""),
+    ('Y+', "Y+", ""),
+    ('Y-', "Y-", ""),
+    ('Z+', "Z+", ""),
+    ('Z-', "Z-", ""),
+)
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    bpy.types.Scene.source_x_axis = bpy.props.EnumProperty(
+# Addon settings, stored on the scene through one pointer property
+class PsychosHelpersSettings(bpy.types.PropertyGroup):
+    source_x_axis: bpy.props.EnumProperty(
         name="Source X+",
         description="Map source X+ axis to target axis",
-        items=[
-            ('X+', "X+", ""),
-            ('X-', "X-", ""),
-            ('Y+', "Y+", ""),
-            ('Y-', "Y-", ""),
-            ('Z+', "Z+", ""),
-            ('Z-', "Z-", ""),
-        ],
+        items=AXIS_ITEMS,
         default='X+',  # Set the default value here
     )
-    bpy.types.Scene.source_y_axis = bpy.props.EnumProperty(
+    source_y_axis: bpy.props.EnumProperty(
         name="Source Y+",
         description="Map source Y+ axis to target axis",
-        items=[
-            ('X+', "X+", ""),
-            ('X-', "X-", ""),
-            ('Y+', "Y+", ""),
-            ('Y-', "Y-", ""),
-            ('Z+', "Z+", ""),
-            ('Z-', "Z-", ""),
-        ],
+        items=AXIS_ITEMS,
         default='Y+',  # Set the default value here
     )
-    bpy.types.Scene.source_z_axis = bpy.props.EnumProperty(
+    source_z_axis: bpy.props.EnumProperty(
         name="Source Z+",
         description="Map source Z+ axis to target axis",
-        items=[
-            ('X+', "X+", ""),
-            ('X-', "X-", ""),
-            ('Y+', "Y+", ""),
-            ('Y-', "Y-", ""),
-            ('Z+', "Z+", ""),
-            ('Z-', "Z-", ""),
-        ],
+        items=AXIS_ITEMS,
         default='Z+',  # Set the default value here
     )
-    bpy.types.Scene.replace_all_keyframes = bpy.props.BoolProperty(
+    replace_all_keyframes: bpy.props.BoolProperty(
         name="Replace All Keyframes",
         description="Replace all keyframes in the target before copying",
         default=True,
     )
-    bpy.types.Scene.secondary_x_axis = bpy.props.EnumProperty(
+    secondary_x_axis: bpy.props.EnumProperty(
         name="Secondary X+",
         description="Map secondary X+ axis to target axis",
-        items=[
-            ('X+', "X+", ""),
-            ('X-', "X-", ""),
-            ('Y+', "Y+", ""),
-            ('Y-', "Y-", ""),
-            ('Z+', "Z+", ""),
-            ('Z-', "Z-", ""),
-        ],
+        items=AXIS_ITEMS,
         default='X+',  # Set the default value here
     )
-    bpy.types.Scene.secondary_y_axis = bpy.props.EnumProperty(
+    secondary_y_axis: bpy.props.EnumProperty(
         name="Secondary Y+",
         description="Map secondary Y+ axis to target axis",
-        items=[
-            ('X+', "X+", ""),
-            ('X-', "X-", ""),
-            ('Y+', "Y+", ""),
-            ('Y-', "Y-", ""),
-            ('Z+', "Z+", ""),
-            ('Z-', "Z-", ""),
-        ],
+        items=AXIS_ITEMS,
         default='Y+',  # Set the default value here
     )
-    bpy.types.Scene.secondary_z_axis = bpy.props.EnumProperty(
+    secondary_z_axis: bpy.props.EnumProperty(
         name="Secondary Z+",
         description="Map secondary Z+ axis to target axis",
-        items=[
-            ('X+', "X+", ""),
-            ('X-', "X-", ""),
-            ('Y+', "Y+", ""),
-            ('Y-', "Y-", ""),
-            ('Z+', "Z+", ""),
-            ('Z-', "Z-", ""),
-        ],
+        items=AXIS_ITEMS,
         default='Z+',  # Set the default value here
     )
-    bpy.types.Scene.secondary_replace_all_keyframes = bpy.props.BoolProperty(
+    secondary_replace_all_keyframes: bpy.props.BoolProperty(
         name="Replace All Keyframes",
         description="Replace all keyframes in the target before copying for secondary mapping",
         default=True,
     )
-    bpy.types.Scene.primary_mapper = bpy.props.StringProperty(
+    primary_mapper: bpy.props.StringProperty(
         name="Primary Mapper",
         description="Primary mapper for axis mapping",
         default="",
     )
-    bpy.types.Scene.primary_suffix = bpy.props.StringProperty(
+    primary_suffix: bpy.props.StringProperty(
         name="Suffix",
         description="Suffix to add to target bone names",
         default="",
     )
-    bpy.types.Scene.secondary_mapper = bpy.props.StringProperty(
+    secondary_mapper: bpy.props.StringProperty(
         name="Secondary Mapper",
         description="Secondary mapper for axis mapping",
         default="",
     )
-    bpy.types.Scene.secondary_suffix = bpy.props.StringProperty(
+    secondary_suffix: bpy.props.StringProperty(
         name="Suffix",
         description="Suffix to add to target bone names for secondary mapping",
         default="",
     )
-    bpy.types.VIEW3D_MT_pose_context_menu.append(pose_context_menu)
-
-    bpy.types.Scene.use_quaternion_rotation = bpy.props.BoolProperty(
-    name="Use Quaternions",
-    description="Swap rotation axes using quaternion channels instead of Euler",
-    default=False,
+    use_quaternion_rotation: bpy.props.BoolProperty(
+        name="Use Quaternions",
+        description="Swap rotation axes using quaternion channels instead of Euler",
+        default=False,
     )
-    bpy.types.Scene.use_x_45d = bpy.props.BoolProperty(
+    use_x_45d: bpy.props.BoolProperty(
         name="X Axis", description="Include X axis for 45° scaling", default=False)
-    bpy.types.Scene.use_y_45d = bpy.props.BoolProperty(
+    use_y_45d: bpy.props.BoolProperty(
         name="Y Axis", description="Include Y axis for 45° scaling", default=False)
-    bpy.types.Scene.use_z_45d = bpy.props.BoolProperty(
+    use_z_45d: bpy.props.BoolProperty(
         name="Z Axis", description="Include Z axis for 45° scaling", default=False)
 
+# Register and Unregister
+classes = [
+    PsychosHelpersSettings,
+    CopyBoneKeyframesOperator,
+    CopyAllAxesKeyframesOperator,
+    CopyBoneKeyframesPanel,
+    SwapAndFlipKeyframesPanel,
+    FlipKeyframeAxisOperator,
+    RemapAllBonesOperator,
+    SwapKeyframesOperator,
+    SwapKeyframeAxisOperator,
+    Calc45dScaleOperator,
+    CopyAxisToAxisOperator,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.psychos_helpers = bpy.props.PointerProperty(type=PsychosHelpersSettings)
+    bpy.types.VIEW3D_MT_pose_context_menu.append(pose_context_menu)
+
 
 def unregister():
-    for cls in classes:
+    del bpy.types.Scene.psychos_helpers
+    for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
-    del bpy.types.Scene.source_x_axis
-    del bpy.types.Scene.source_y_axis
-    del bpy.types.Scene.source_z_axis
-    del bpy.types.Scene.replace_all_keyframes
-    del bpy.types.Scene.secondary_x_axis
-    del bpy.types.Scene.secondary_y_axis
-    del bpy.types.Scene.secondary_z_axis
-    del bpy.types.Scene.secondary_replace_all_keyframes
-    del bpy.types.Scene.primary_mapper
-    del bpy.types.Scene.primary_suffix
-    del bpy.types.Scene.secondary_mapper
-    del bpy.types.Scene.secondary_suffix
     bpy.types.VIEW3D_MT_pose_context_menu.remove(pose_context_menu)
-    del bpy.types.Scene.use_quaternion_rotation
-    del bpy.types.Scene.use_x_45d
-    del bpy.types.Scene.use_y_45d
-    del bpy.types.Scene.use_z_45d
+    scratch_buffers.clear()
 
 
 